@@ -1,31 +1,49 @@
+import mmap
 import os
 import re
-import shutil
+
+# compiled once and scanned over the whole file; the leading literal lets re
+# skip straight to each MCR_CVU_, and [^\n] keeps a match within its line
+PATTERN = re.compile(rb'(MCR_CVU_\d+)[^\n]*?(\d+)')
+# mlst.sh writes one short file per sample, which a plain read handles
+# fastest; only large concatenated reports are worth mapping
+MMAP_MIN_SIZE = 1 << 20
+
+
+def extract(data):
+    line_end = 0
+    for match in PATTERN.finditer(data):
+        # keep only the first match on each line, like a per-line search
+        if match.start() < line_end:
+            continue
+        line_end = data.find(b'\n', match.end()) + 1 or len(data)
+        # Extract the number and the name of the file
+        yield match.group(1).decode('ascii'), match.group(2).decode('ascii')
 
 
 source_folder = 'Enter your path'
 base_folder = 'Enter your path'
 extracted_info = []
+created = set()
 
 for filename in os.listdir(source_folder):
     file_path = os.path.join(source_folder, filename)
     if os.path.isfile(file_path):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            # Read the file line by line
-            for line in file:
-                # make sure the line is not empty
-                if 'MCR_CVU_' in line:
-                    # Extract the number and the name of the file
-                    match = re.search(r'(MCR_CVU_\d+).*?(\d+)', line)
-                    if match:
-                        number = match.group(2)
-                        # assign the name of the file to the number
-                        target_folder = os.path.join(base_folder, number)
-                        if not os.path.exists(target_folder):
-                            os.makedirs(target_folder)
-                        # generate the target file path
-                        target_file_path = os.path.join(target_folder, match.group(1)+"_mysnps")
-                        # move the file to the target folder
-                        current_file_path = os.path.join(base_folder, match.group(1)+"_mysnps")
-                        #print(current_file_path, target_file_path)
-                        shutil.move(current_file_path, target_file_path)
\ No newline at end of file
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < MMAP_MIN_SIZE:
+                extracted_info.extend(extract(file.read()))
+            else:
+                # pages of a large file are read lazily as the scan reaches them
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    extracted_info.extend(extract(data))
+
+for name, number in extracted_info:
+    snps_name = f"{name}_mysnps"
+    # assign the name of the file to the number
+    target_folder = os.path.join(base_folder, number)
+    if target_folder not in created:
+        os.makedirs(target_folder, exist_ok=True)
+        created.add(target_folder)
+    # move the file to the target folder; both paths sit under base_folder,
+    # so this is a plain rename on the same filesystem
+    os.replace(os.path.join(base_folder, snps_name), os.path.join(target_folder, snps_name))
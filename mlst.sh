@@ -5,6 +5,12 @@ directory="Enter your path"
 
 output_base="Enter your path"
 
+# make sure mlst is on PATH before looping over the samples
+if ! command -v mlst > /dev/null; then
+    echo "mlst not found in PATH" >&2
+    exit 1
+fi
+
 for folder in "$directory"/*; do
     if [ -d "$folder" ]; then
         output_dir="$output_base/$(basename "$folder")_mlst_output"